@@ -1,3 +1,21 @@
 """chromo_map package for color management."""
 
 from .color import *
+from .color import _LAZY_ATTRS
+from . import color
+
+# Star imports don't consult ``__getattr__``, so list the lazy catalogs explicitly.
+# ``from chromo_map import *`` builds them; a plain ``import chromo_map`` does not.
+__all__ = [name for name in dir() if not name.startswith("_")] + list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """Build ``cmaps`` lazily on first access; see ``chromo_map.color``."""
+    try:
+        return color.__getattr__(name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
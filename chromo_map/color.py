@@ -1,7 +1,9 @@
 """Color module for chromo_map package."""
 
 import re
+import itertools
 import uuid
+from functools import lru_cache
 from typing import Tuple
 from textwrap import dedent
 import json
@@ -10,49 +12,47 @@ from importlib_resources import files
 from IPython.display import HTML
 from jinja2 import Template
 import numpy as np
+import matplotlib
 from _plotly_utils import colors as plotly_colors
 from matplotlib.colors import LinearSegmentedColormap as LSC
 from matplotlib.colors import ListedColormap as LC
-from matplotlib.colors import to_rgba, to_rgb
+from matplotlib.colors import to_rgba
 import matplotlib.pyplot as plt
-import svgwrite
 import palettable
 from palettable.palette import Palette
 from pirrtools import AttrDict, find_instances
 from pirrtools.sequences import lcm
-from bs4 import BeautifulSoup
-
-
-def _rgb_c(c):
-    return rf"(?P<{c}>[^,\s]+)"
-
 
 _COMMA = r"\s*,\s*"
-_red = _rgb_c("red")
-_grn = _rgb_c("grn")
-_blu = _rgb_c("blu")
-_alp = _rgb_c("alp")
-_rgb_pat = _COMMA.join([_red, _grn, _blu]) + f"({_COMMA}{_alp})?"
-_RGB_PATTERN = re.compile(rf"rgba?\({_rgb_pat}\)")
+_CHANNEL = r"([^,\s]+)"
+_rgb_pat = _COMMA.join([_CHANNEL] * 3) + f"(?:{_COMMA}{_CHANNEL})?"
+_RGB_PATTERN = re.compile(rf"rgba?\({_rgb_pat}\)", re.ASCII)
+# Property-cycle specs like "C0" follow rcParams["axes.prop_cycle"], so matplotlib
+# never caches them and neither can we.
+_NTH_COLOR = re.compile(r"C[0-9]+")
 
-_VALID_MPL_COLORS = plt.colormaps()
+# Membership checks go straight to matplotlib's colormap registry, which is a hash
+# lookup and also sees colormaps registered after import.
+_VALID_MPL_COLORS = matplotlib.colormaps
 
 
 def rgba_to_tup(rgbstr):
     """Convert an RGBA string to a tuple."""
-    match = _RGB_PATTERN.match(rgbstr)
+    match = _RGB_PATTERN.fullmatch(rgbstr)
     if match:
-        gdict = match.groupdict()
-        red = int(gdict["red"])
-        grn = int(gdict["grn"])
-        blu = int(gdict["blu"])
-        if (alp := gdict["alp"]) is not None:
+        red, grn, blu, alp = match.groups()
+        red = int(red)
+        grn = int(grn)
+        blu = int(blu)
+        if not (0 <= red <= 255 and 0 <= grn <= 255 and 0 <= blu <= 255):
+            raise ValueError("RGB values must be between 0 and 255.")
+        if alp is not None:
             alp = float(alp)
             if not 0 <= alp <= 1:
                 raise ValueError("Alpha must be between 0 and 1.")
         else:
             alp = 1
-        return to_rgb(f"#{red:02x}{grn:02x}{blu:02x}") + (alp,)
+        return red / 255, grn / 255, blu / 255, alp
     return None
 
 
@@ -64,10 +64,21 @@ def hexstr_to_tup(hexstr: str) -> Tuple[int, int, int, int]:
         return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_str(clr):
+    return hexstr_to_tup(clr) or rgba_to_tup(clr)
+
+
+def _str_to_tup(clr):
+    if _NTH_COLOR.fullmatch(clr):
+        return hexstr_to_tup(clr)
+    return _parse_str(clr)
+
+
 def clr_to_tup(clr):
     """Convert a color to a tuple."""
     if isinstance(clr, str):
-        return hexstr_to_tup(clr) or rgba_to_tup(clr)
+        return _str_to_tup(clr)
     if isinstance(clr, (tuple, list)):
         return clr
     try:
@@ -76,6 +87,107 @@ def clr_to_tup(clr):
         return None
 
 
+def _clr_rows(clrs):
+    rows = []
+    for clr in clrs:
+        if isinstance(clr, str):
+            tup = _str_to_tup(clr)
+            if tup is None:
+                raise ValueError("Invalid color input.")
+            rows.append(tup)
+        elif isinstance(clr, Color):
+            rows.append(clr.tup)
+        else:
+            rows.append(Color(clr).tup)
+    return rows
+
+
+def _rows_to_rgba(rows):
+    # Every row is a 4-tuple, so a flat fromiter beats np.array on nested tuples.
+    flat = np.fromiter(itertools.chain.from_iterable(rows), np.float64, 4 * len(rows))
+    return _rgba_array(flat.reshape(-1, 4))
+
+
+def clrs_to_rgba(clrs):
+    """Convert a sequence of colors to an (N, 4) RGBA array.
+
+    Each item may be anything :class:`Color` accepts. Strings go through the same
+    cache as single colors and the range check runs once for the whole array.
+    """
+    return _rows_to_rgba(_clr_rows(clrs))
+
+
+def _rgba_array(arr, alpha=None):
+    """Validate an (N, 3) or (N, 4) array of colors and return it as (N, 4) RGBA."""
+    rgba = np.array(arr, dtype=np.float64)
+    if rgba.ndim != 2 or rgba.shape[1] not in (3, 4):
+        raise ValueError("Color arrays must have shape (N, 3) or (N, 4).")
+    if rgba.shape[1] == 3:
+        rgba = np.column_stack((rgba, np.ones(len(rgba))))
+    if alpha is not None:
+        rgba[:, 3] = alpha
+    if not ((rgba >= 0) & (rgba <= 1)).all():
+        raise ValueError("Color values must be between 0 and 1.")
+    return rgba
+
+
+# Two-digit hex for every 8-bit channel value; indexing is much cheaper than a
+# ``:02x`` format spec per channel.
+_HEX2 = tuple(f"{i:02x}" for i in range(256))
+
+_HTML_ID_PREFIX = uuid.uuid4().hex[:12]
+_html_ids = itertools.count()
+
+
+def _html_id():
+    """Return an element id unique to this process.
+
+    The random prefix keeps ids from clashing with output left over from an earlier
+    kernel in the same notebook, without a uuid4 call per render.
+    """
+    return f"{_HTML_ID_PREFIX}{next(_html_ids):x}"
+
+
+_COLOR_HTML = """\
+<div>
+    <style>
+        #_{id} {{
+            position: relative;
+            display: inline-block;
+            cursor: pointer;
+            background: {rgba};
+            width: 2rem; height: 1.5rem;
+        }}
+        #_{id}::after {{
+            content: attr(data-tooltip);
+            position: absolute;
+            bottom: 50%;
+            left: 0%;
+            transform: translateY(50%);
+            padding: 0.125rem;
+            white-space: pre;
+            font-size: 0.75rem;
+            font-family: monospace;
+            background: rgba(0, 0, 0, 0.6);
+            backdrop-filter: blur(0.25rem);
+            color: white;
+            border-radius: 0.25rem;
+            opacity: 0;
+            pointer-events: none;
+            transition: opacity 0.1s ease-in-out;
+            z-index: -1;
+        }}
+        #_{id}:hover::after {{
+            opacity: 1;
+            z-index: 1;
+        }}
+    </style>
+    <div id="_{id}" class="color" data-tooltip="RGBA: {rgba_body}
+HEXA: {hexa}"></div>
+</div>
+"""
+
+
 class Color:
     """A class for representing colors.
 
@@ -160,11 +272,14 @@ class Color:
 
     """
 
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(self, clr, alpha=None):
         if isinstance(clr, Color):
-            self.__dict__.update(clr.__dict__)
-            if alpha is not None:
-                self.a = alpha
+            self.r = clr.r
+            self.g = clr.g
+            self.b = clr.b
+            self.a = clr.a if alpha is None else alpha
         else:
             if isinstance(clr, (tuple, list, np.ndarray)):
                 red, grn, blu, *alp = clr
@@ -176,7 +291,7 @@ class Color:
                     alp = 1
 
             elif isinstance(clr, str):
-                tup = clr_to_tup(clr)
+                tup = _str_to_tup(clr)
                 if tup is None:
                     raise ValueError("Invalid color input.")
                 red, grn, blu, alp = tup
@@ -185,7 +300,7 @@ class Color:
             else:
                 raise ValueError(f"Invalid color input '{type(clr).__name__}'.")
 
-            if all(map(lambda x: 0 <= x <= 1, (red, grn, blu, alp))):
+            if 0 <= red <= 1 and 0 <= grn <= 1 and 0 <= blu <= 1 and 0 <= alp <= 1:
                 self.r = red
                 self.g = grn
                 self.b = blu
@@ -193,6 +308,50 @@ class Color:
             else:
                 raise ValueError("Color values must be between 0 and 1.")
 
+    @classmethod
+    def _from_rgba(cls, red, grn, blu, alp):
+        """Build a color from channel values that are already validated."""
+        clr = object.__new__(cls)
+        clr.r = red
+        clr.g = grn
+        clr.b = blu
+        clr.a = alp
+        return clr
+
+    @classmethod
+    def from_array(cls, arr, alpha=None):
+        """Create colors from an array of RGB or RGBA rows.
+
+        The whole array is validated at once, which is much faster than
+        constructing each color separately.
+
+        Parameters
+        ----------
+        arr : array-like
+            An (N, 3) or (N, 4) array of values between 0 and 1.
+        alpha : float, optional
+            An alpha value between 0 and 1 that overrides the array's alpha.
+
+        Returns
+        -------
+        List[Color]
+            One color per row.
+
+        Examples
+        --------
+
+        .. testcode::
+
+            from chromo_map import Color
+            Color.from_array([[1, 0, 0], [0, 0, 1]], alpha=0.5)[1].tup
+
+        .. testoutput::
+
+            (0.0, 0.0, 1.0, 0.5)
+
+        """
+        return _colors_from_rows(_rgba_array(arr, alpha).tolist(), cls)
+
     @property
     def tup(self):
         """Return the color as a tuple.
@@ -245,7 +404,12 @@ class Color:
             (255, 165, 0, 127)
 
         """
-        return tuple(int(x * 255) for x in self.tup)
+        return (
+            int(self.r * 255),
+            int(self.g * 255),
+            int(self.b * 255),
+            int(self.a * 255),
+        )
 
     @property
     def hextup(self):
@@ -354,7 +518,7 @@ class Color:
 
         """
         r, g, b = self.hextup
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return f"#{_HEX2[r]}{_HEX2[g]}{_HEX2[b]}"
 
     @property
     def hexa(self):
@@ -382,7 +546,7 @@ class Color:
 
         """
         r, g, b, a = self.hexatup
-        return f"#{r:02x}{g:02x}{b:02x}{a:02x}"
+        return f"#{_HEX2[r]}{_HEX2[g]}{_HEX2[b]}{_HEX2[a]}"
 
     @property
     def rgb(self):
@@ -480,8 +644,48 @@ class Color:
         g = self.g + (other.g - self.g) * factor
         b = self.b + (other.b - self.b) * factor
         a = self.a + (other.a - self.a) * factor
+        if 0 <= factor <= 1:
+            # A blend of two valid colors is always in range.
+            return Color._from_rgba(r, g, b, a)
         return Color((r, g, b, a))
 
+    def interpolate_many(self, other, factors):
+        """Interpolate between two colors at several factors at once.
+
+        Parameters
+        ----------
+        other : Color
+            The other color to interpolate with.
+        factors : float or array-like
+            The interpolation factors between 0 and 1.  A scalar is treated as a
+            single factor.
+
+        Returns
+        -------
+        List[Color]
+            One interpolated color per factor.
+
+        Examples
+        --------
+
+        .. testcode::
+
+            from chromo_map import Color
+            red = Color('red')
+            [c.hex for c in red.interpolate_many(Color('blue'), [0, 0.5, 1])]
+
+        .. testoutput::
+
+            ['#ff0000', '#7f007f', '#0000ff']
+
+        """
+        factors = np.atleast_1d(np.asarray(factors, dtype=np.float64))
+        if factors.ndim != 1:
+            raise ValueError("Interpolation factors must be a scalar or 1-D.")
+        factors = factors[:, None]
+        start = np.array(self.tup)
+        return Color.from_array(start + (np.array(other.tup) - start) * factors)
+
     def __or__(self, other):
         """Interpolate between two colors assuming a factor of 0.5.
 
@@ -518,56 +722,13 @@ class Color:
         return self.interpolate(other, 0.5)
 
     def _repr_html_(self):
-        random_id = uuid.uuid4().hex
-        style = dedent(
-            f"""\
-        <style>
-            #_{random_id} {{ 
-                position: relative;
-                display: inline-block;
-                cursor: pointer;
-                background: {self.rgba};
-                width: 2rem; height: 1.5rem;
-            }}
-            #_{random_id}::after {{
-                content: attr(data-tooltip);
-                position: absolute;
-                bottom: 50%;
-                left: 0%;
-                transform: translateY(50%);
-                padding: 0.125rem;
-                white-space: pre;
-                font-size: 0.75rem;
-                font-family: monospace;
-                background: rgba(0, 0, 0, 0.6);
-                backdrop-filter: blur(0.25rem);
-                color: white;
-                border-radius: 0.25rem;
-                opacity: 0;
-                pointer-events: none;
-                transition: opacity 0.1s ease-in-out;
-                z-index: -1;
-            }}
-            #_{random_id}:hover::after {{
-                opacity: 1;
-                z-index: 1;
-            }}
-        </style>       
-        """
-        )
-        tooltip = dedent(
-            f"""\
-        RGBA: {self.rgba[5:-1]}
-        HEXA: {self.hexa}\
-        """
-        )
-        return dedent(
-            f"""\
-            <div>
-                {style}
-                <div id="_{random_id}" class="color" data-tooltip="{tooltip}"></div>
-            </div>
-        """
+        r, g, b, a = self.hexatup
+        rgba_body = f"{r}, {g}, {b}, {self.a:.1f}"
+        return _COLOR_HTML.format(
+            id=_html_id(),
+            rgba=f"rgba({rgba_body})",
+            rgba_body=rgba_body,
+            hexa=f"#{_HEX2[r]}{_HEX2[g]}{_HEX2[b]}{_HEX2[a]}",
         )
 
     def __eq__(self, other):
@@ -585,7 +746,129 @@ class Color:
         bool
             Whether the colors are equal.
         """
-        return np.isclose(self.tup, other.tup).all()
+        # Same tolerances as ``np.isclose`` without building arrays for four values.
+        red, grn, blu, alp = other.tup
+        return (
+            abs(self.r - red) <= 1e-8 + 1e-5 * abs(red)
+            and abs(self.g - grn) <= 1e-8 + 1e-5 * abs(grn)
+            and abs(self.b - blu) <= 1e-8 + 1e-5 * abs(blu)
+            and abs(self.a - alp) <= 1e-8 + 1e-5 * abs(alp)
+        )
+
+
+def _colors_from_rows(rows, cls=Color):
+    """Build colors from RGBA rows that are already validated."""
+    new = object.__new__
+    colors = []
+    for red, grn, blu, alp in rows:
+        clr = new(cls)
+        clr.r = red
+        clr.g = grn
+        clr.b = blu
+        clr.a = alp
+        colors.append(clr)
+    return colors
+
+
+_GRADIENT_DIV_TEMPLATE = Template(
+    dedent(
+        """\
+        <div class="gradient">
+            <style>
+                #_{{ random_id }} {
+                    display: flex; gap: 0rem; width: {{ max_width }}rem;
+                }
+                #_{{ random_id }} div { flex: 1 1 0; }
+                #_{{ random_id }} div.color { width: 100%; height: 100%; }
+                #_{{ random_id }} div.cmap { width: 100%; height: auto; }
+                #_{{ random_id }} div.cmap > img { width: 100%; height: 100%; }
+            </style>
+            <strong>{{ name }}</strong>
+            {% if as_png %}
+            {{ colors.to_png().data }}
+            {% else %}
+            <div id="_{{ random_id }}" class="color-map">
+                {% for clr in colors.colors %}
+                    {{ clr._repr_html_() }}
+                {% endfor %}
+            </div>
+            {% endif %}
+        </div>
+"""
+    )
+)
+
+_SWATCH_GRID_TEMPLATE = Template(
+    dedent(
+        """\
+            <div id="_{{ random_id }}" class="color-swatch">
+                <style>
+                    #_{{ random_id }} {
+                        display: grid;
+                        grid-template-columns: repeat(auto-fill, minmax(10rem, 1fr));
+                        gap: 0.5rem 1rem;
+                        justify-content: space-between;
+                        overflow: hidden;
+                        resize: both;
+                        width: min(65rem, 100%);
+                    }
+                    #_{{ random_id }} div {
+                        width: 100%;
+                    }
+                    #_{{ random_id }} > div.gradient {
+                        width: 100%;
+                        height: min(4rem, 100%);
+                        display: grid;
+                        gap: 0.2rem;
+                        grid-template-rows: 1rem auto;
+                    }
+                    #_{{ random_id }} .color {
+                        height: minmax(1.5rem, 100%);
+                    }
+                    #_{{ random_id }} > div.gradient > strong {
+                        margin: 0;
+                        padding: 0;
+                    }
+                    #_{{ random_id }} img {height: 100%;}
+                </style>
+                {% for cmap in maps %}
+                    {{ cmap.to_div(maxn, as_png=as_png).data }}
+                {% endfor %}
+            </div>
+"""
+    )
+)
+
+
+_COLOR_PASS_THROUGH = frozenset(
+    (
+        "tup",
+        "hex",
+        "hexa",
+        "rgb",
+        "rgba",
+        "hextup",
+        "rgbtup",
+        "hexatup",
+        "rgbatup",
+        "r",
+        "g",
+        "b",
+        "a",
+    )
+)
+
+
+def _resample_rgba(rgba, num):
+    """Linearly resample an (N, 4) RGBA array to ``num`` evenly spaced rows.
+
+    Matches what ``LinearSegmentedColormap.from_list(...).resampled(num)`` produces
+    without building the intermediate colormap.
+    """
+    src = np.linspace(0, 1, len(rgba))
+    dst = np.linspace(0, 1, num)
+    resampled = np.column_stack([np.interp(dst, src, rgba[:, i]) for i in range(4)])
+    return np.clip(resampled, 0, 1)
 
 
 class ColorGradient(LSC):
@@ -628,10 +911,20 @@ class ColorGradient(LSC):
     """
 
     def _update_from_list(self, colors, name, alpha):
-        if not list(colors):
+        if len(colors) == 0:
             raise ValueError("No valid colors found.")
-        self.colors = tuple(Color(clr, alpha) for clr in colors)
-        mpl_colormap = LSC.from_list(name=name, colors=self.tup, N=len(self.colors))
+        if isinstance(colors, np.ndarray) and colors.dtype.kind in "biuf":
+            # Numeric arrays are validated in one pass instead of color by color.
+            self._rgba = _rgba_array(colors, alpha)
+            rows = self._rgba.tolist()
+        else:
+            if alpha is None:
+                rows = _clr_rows(colors)
+            else:
+                rows = [Color(clr, alpha).tup for clr in colors]
+            self._rgba = _rows_to_rgba(rows)
+        self.colors = tuple(_colors_from_rows(rows))
+        mpl_colormap = LSC.from_list(name=name, colors=self._rgba, N=len(self.colors))
         self.__dict__.update(mpl_colormap.__dict__)
 
     def with_alpha(self, alpha, name=None):
@@ -670,9 +963,7 @@ class ColorGradient(LSC):
             print(gradient.with_alpha(0.5)._repr_html_())
 
         """
-        return ColorGradient(
-            [Color(clr, alpha) for clr in self.colors], name=name or self.name
-        )
+        return ColorGradient(self.colors, name=name or self.name, alpha=alpha)
 
     def __init__(self, colors, name=None, alpha=None):
         name = name or "custom" if not hasattr(colors, "name") else colors.name
@@ -701,22 +992,7 @@ class ColorGradient(LSC):
             self._update_from_list(cmap(np.arange(cmap.N)), name, alpha)
 
     def __getattr__(self, name):
-        pass_through = (
-            "tup",
-            "hex",
-            "hexa",
-            "rgb",
-            "rgba",
-            "hextup",
-            "rgbtup",
-            "hexatup",
-            "rgbatup",
-            "r",
-            "g",
-            "b",
-            "a",
-        )
-        if name in pass_through:
+        if name in _COLOR_PASS_THROUGH:
             return [getattr(clr, name) for clr in self.colors]
         raise AttributeError(f"'ColorGradient' object has no attribute '{name}'")
 
@@ -736,14 +1012,32 @@ class ColorGradient(LSC):
 
             x, i = np.modf(key * (self.N - 1))
             i = int(i)
-            j = i + 1
+            j = min(i + 1, len(self.colors) - 1)
             c0 = self.colors[i]
             c1 = self.colors[j]
             return c0.interpolate(c1, x)
         if isinstance(key, (list, tuple, np.ndarray)):
-            return ColorGradient([self[x] for x in key])
+            if isinstance(key, np.ndarray) and key.dtype.kind == "f":
+                colors = self._sample(key)
+            else:
+                colors = [self[x] for x in key]
+            return ColorGradient(colors)
         raise IndexError(f"Invalid index: {key}")
 
+    def _sample(self, positions):
+        """Interpolate the RGBA rows at ``positions`` between 0 and 1.
+
+        Gives the same values as indexing with each float separately.
+        """
+        if not ((positions >= 0) & (positions <= 1)).all():
+            bad = positions[~((positions >= 0) & (positions <= 1))][0]
+            raise IndexError(f"Invalid index: {bad}")
+        frac, i = np.modf(positions * (self.N - 1))
+        i = i.astype(np.intp)
+        j = np.minimum(i + 1, len(self._rgba) - 1)
+        start = self._rgba[i]
+        return start + (self._rgba[j] - start) * frac[:, None]
+
     def __iter__(self):
         return iter(self.colors)
 
@@ -872,36 +1166,9 @@ class ColorGradient(LSC):
         else:
             cmap = self
 
-        template = Template(
-            dedent(
-                """\
-        <div class="gradient">
-            <style>
-                #_{{ random_id }} {
-                    display: flex; gap: 0rem; width: {{ max_width }}rem;
-                }
-                #_{{ random_id }} div { flex: 1 1 0; }
-                #_{{ random_id }} div.color { width: 100%; height: 100%; }
-                #_{{ random_id }} div.cmap { width: 100%; height: auto; }
-                #_{{ random_id }} div.cmap > img { width: 100%; height: 100%; }
-            </style>
-            <strong>{{ name }}</strong>
-            {% if as_png %}
-            {{ colors.to_png().data }}
-            {% else %}
-            <div id="_{{ random_id }}" class="color-map">
-                {% for clr in colors.colors %}
-                    {{ clr._repr_html_() }}
-                {% endfor %}
-            </div>
-            {% endif %}
-        </div>
-        """
-            )
-        )
-        random_id = uuid.uuid4().hex
+        random_id = _html_id()
         return HTML(
-            template.render(
+            _GRADIENT_DIV_TEMPLATE.render(
                 name=cmap.name,
                 colors=cmap,
                 random_id=random_id,
@@ -926,6 +1193,8 @@ class ColorGradient(LSC):
 
     def to_drawing(self, width=500, height=50, filename=None):
         """Convert the gradient to an SVG drawing."""
+        import svgwrite  # pylint: disable=import-outside-toplevel
+
         dwg = svgwrite.Drawing(filename, profile="tiny", size=(width, height))
         rect_width = width / self.N
 
@@ -954,6 +1223,8 @@ class ColorGradient(LSC):
 
     def _repr_html_(self, skip_super=False):
         if hasattr(super(), "_repr_html_") and not skip_super:
+            from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
             return BeautifulSoup(super()._repr_html_(), "html.parser").prettify()
         return self.to_div().data
 
@@ -982,7 +1253,9 @@ class ColorGradient(LSC):
         return ColorGradient([x | y for x, y in zip(a, b)], name=name)
 
     def __eq__(self, other):
-        return np.isclose(self.tup, other.tup).all()
+        # Compare the Colors, like tup and hex do: _rgba is not updated when a
+        # Color in this gradient is mutated.
+        return len(self) == len(other) and np.isclose(self.tup, other.tup).all()
 
 
 class Swatch:
@@ -992,10 +1265,7 @@ class Swatch:
         self.maxn = maxn
         self.maps = []
         for name, colors in maps.items():
-            try:
-                self.maps.append(ColorGradient(colors, name=name))
-            except ValueError as e:
-                raise e
+            self.maps.append(ColorGradient(colors, name=name))
         self._repr_html_ = self.to_grid
 
     def to_dict(self):
@@ -1008,63 +1278,30 @@ class Swatch:
         return len(self.maps)
 
     def with_max(self, maxn):
-        return Swatch(self.to_dict(), maxn=maxn)
+        swatch = Swatch({}, maxn=maxn)
+        # Rebuild from the packed RGBA blocks so the two swatches never share
+        # Colors, and matplotlib mutators like set_bad don't leak between them.
+        swatch.maps = [
+            ColorGradient(cmap._rgba, name=cmap.name)  # pylint: disable=protected-access
+            for cmap in self.maps
+        ]
+        return swatch
 
     def to_grid(self, as_png=False):
         """Convert the swatch to an HTML grid."""
         n = len(self.maps)
         if n == 0:
             return ""
-        template = Template(
-            dedent(
-                """\
-            <div id="_{{ random_id }}" class="color-swatch">
-                <style>
-                    #_{{ random_id }} {
-                        display: grid;
-                        grid-template-columns: repeat(auto-fill, minmax(10rem, 1fr));
-                        gap: 0.5rem 1rem;
-                        justify-content: space-between;
-                        overflow: hidden;
-                        resize: both;
-                        width: min(65rem, 100%);
-                    }
-                    #_{{ random_id }} div {
-                        width: 100%;
-                    }
-                    #_{{ random_id }} > div.gradient {
-                        width: 100%;
-                        height: min(4rem, 100%);
-                        display: grid;
-                        gap: 0.2rem;
-                        grid-template-rows: 1rem auto;
-                    }
-                    #_{{ random_id }} .color {
-                        height: minmax(1.5rem, 100%);
-                    }
-                    #_{{ random_id }} > div.gradient > strong {
-                        margin: 0;
-                        padding: 0;
-                    }
-                    #_{{ random_id }} img {height: 100%;}
-                </style>
-                {% for cmap in maps %}
-                    {{ cmap.to_div(maxn, as_png=as_png).data }}
-                {% endfor %}
-            </div>
-        """
-            )
-        )
-        random_id = uuid.uuid4().hex
+        random_id = _html_id()
         return HTML(
-            template.render(
+            _SWATCH_GRID_TEMPLATE.render(
                 maps=self.maps, random_id=random_id, maxn=self.maxn, as_png=as_png
             )
         )
 
 
 def _gud_name(name):
-    return not (name[0] == "_" or name[-2:] == "_r")
+    return not (name.startswith("_") or name.endswith("_r"))
 
 
 class ColorMaps(AttrDict):
@@ -1103,13 +1340,20 @@ class ColorMaps(AttrDict):
     """
 
     def __getattr__(self, item):
-        if item in self:
-            value = super().__getattr__(item)
+        value = self.get(item)
+        if value is not None:
             if not isinstance(value, type(self)):
-                cmap = self._convert(value, item)
-                if cmap.N > 32:
-                    cmap = cmap.resize(32)
-                return cmap
+                # Converted gradients are memoized per key, but every lookup gets
+                # fresh Colors built from the packed RGBA block so edits to one
+                # lookup's colors, or matplotlib mutators like set_bad, don't leak.
+                gradients = self.__dict__.setdefault("_gradients", {})
+                cached = gradients.get(item)
+                if cached is None or cached[0] is not value:
+                    cmap = self._convert(value, item)
+                    if cmap.N > 32:
+                        cmap = cmap.resize(32)
+                    cached = gradients[item] = (value, cmap)
+                return ColorGradient(cached[1]._rgba, name=cached[1].name)
             return value
         temp = type(self)({k: v for k, v in self.items() if k.startswith(item)})
         if temp:
@@ -1124,7 +1368,17 @@ class ColorMaps(AttrDict):
 
     @property
     def _swatch(self):
-        return Swatch(self.maps)
+        # Building the swatch converts every gradient in this level, so keep it
+        # for as long as the keys and the value objects it was built from are
+        # unchanged.  Keying on identities catches every dict mutator without
+        # comparing values, but in-place edits to a stored value go unnoticed.
+        items = tuple(self.items())
+        key = tuple((k, id(v)) for k, v in items)
+        cached = self.__dict__.get("_swatch_cache")
+        if cached is None or cached[0] != key:
+            # Hold the items so their ids can't be reused while the key is cached.
+            cached = self.__dict__["_swatch_cache"] = (key, Swatch(self.maps), items)
+        return cached[1]
 
     def _repr_html_(self):
         return self._swatch.to_grid(as_png=True).data
@@ -1152,38 +1406,82 @@ class PalettableColorMaps(ColorMaps):
 
 
 class MPLColorMaps(ColorMaps):
+    """Color gradients named after matplotlib's registered colormaps."""
 
     def _valid(self, value):
-        return value in _VALID_MPL_COLORS
+        return isinstance(value, str) and value in _VALID_MPL_COLORS
 
     def _convert(self, value, name):
-        return ColorGradient(value, name=name)
+        cmap = plt.get_cmap(value)
+        if cmap.N > 32:
+            # Resample the lookup table before wrapping so the 256-color gradient
+            # that ColorMaps would immediately resize is never built.
+            return ColorGradient(_resample_rgba(cmap(np.arange(cmap.N)), 32), name=name)
+        return ColorGradient(cmap, name=name)
 
 
-plotly_cmaps = find_instances(
-    cls=list,
-    module=plotly_colors,
-    tracker_type=PlotlyColorMaps,
-    filter_func=lambda name, _: _gud_name(name),
-)
+@lru_cache(maxsize=None)
+def _build_plotly_cmaps():
+    return find_instances(
+        cls=list,
+        module=plotly_colors,
+        tracker_type=PlotlyColorMaps,
+        filter_func=lambda name, _: _gud_name(name),
+    )
 
-palettable_cmaps = find_instances(
-    cls=Palette,
-    module=palettable,
-    tracker_type=PalettableColorMaps,
-    filter_func=lambda name, _: _gud_name(name),
-)
 
-mpl_dat = json.loads(
-    files("chromo_map.data").joinpath("mpl_cat_names.json").read_text()
-)
+@lru_cache(maxsize=None)
+def _build_palettable_cmaps():
+    return find_instances(
+        cls=Palette,
+        module=palettable,
+        tracker_type=PalettableColorMaps,
+        filter_func=lambda name, _: _gud_name(name),
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_mpl_cmaps():
+    mpl_dat = json.loads(
+        files("chromo_map.data").joinpath("mpl_cat_names.json").read_bytes()
+    )
+    return MPLColorMaps({cat: {name: name for name in names} for cat, names in mpl_dat})
+
+
+_CMAP_BUILDERS = {
+    "plotly": _build_plotly_cmaps,
+    "palettable": _build_palettable_cmaps,
+    "mpl": _build_mpl_cmaps,
+}
+_CMAPS_ALIASES = {
+    "plotly_cmaps": "plotly",
+    "palettable_cmaps": "palettable",
+    "mpl_cmaps": "mpl",
+}
 
-mpl_cmaps = MPLColorMaps(
-    {cat: {name: name for name in names} for cat, names in mpl_dat}
-)
 
+@lru_cache(maxsize=None)
+def _build_cmaps():
+    cmaps = AttrDict()
+    for source, build in _CMAP_BUILDERS.items():
+        cmaps[source] = build()
+    return cmaps
 
-cmaps = AttrDict()
-cmaps["plotly"] = plotly_cmaps
-cmaps["palettable"] = palettable_cmaps
-cmaps["mpl"] = mpl_cmaps
+
+_LAZY_ATTRS = ("cmaps", *_CMAPS_ALIASES)
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
+
+
+def __getattr__(name):
+    """Build ``cmaps`` and the per-source catalogs on first access.
+
+    Each source is walked only when it, or ``cmaps`` as a whole, is first asked for.
+    """
+    if name == "cmaps":
+        return _build_cmaps()
+    if name in _CMAPS_ALIASES:
+        return _CMAP_BUILDERS[_CMAPS_ALIASES[name]]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,8 @@
 This module contains test functions to be used with the pytest framework.
 """
 
+import subprocess
+import sys
 import pytest
 import chromo_map as cm
 from chromo_map import Color, ColorGradient
@@ -134,6 +136,37 @@ def test_color_06():
         Color((1.1, 0, 0))
 
 
+def test_color_from_array_01():
+    clrs = Color.from_array(cm.np.array([[1, 0, 0], [0, 0, 1]]), alpha=0.5)
+    assert [c.tup for c in clrs] == [(1, 0, 0, 0.5), (0, 0, 1, 0.5)]
+    assert clrs == [Color("red", 0.5), Color("blue", 0.5)]
+
+
+def test_color_from_array_02():
+    with pytest.raises(ValueError, match="Color values must be between 0 and 1."):
+        Color.from_array([[1.1, 0, 0]])
+    with pytest.raises(ValueError, match=r"shape \(N, 3\) or \(N, 4\)"):
+        Color.from_array([1, 0, 0])
+
+
+def test_color_interpolate_many_01():
+    red, blue = Color("red"), Color("blue")
+    factors = [0, 0.25, 0.5, 1]
+    assert red.interpolate_many(blue, factors) == [
+        red.interpolate(blue, f) for f in factors
+    ]
+    assert red.interpolate_many(blue, 0.5) == [red.interpolate(blue, 0.5)]
+    with pytest.raises(ValueError, match="scalar or 1-D"):
+        red.interpolate_many(blue, [[0, 0.5]])
+
+
+def test_color_eq_01():
+    c = Color((0.5, 0.25, 0.125, 1.0))
+    assert c == Color((0.5 + 1e-9, 0.25, 0.125, 1.0))
+    assert c != Color((0.5 + 1e-4, 0.25, 0.125, 1.0))
+    assert c != Color((0.5, 0.25, 0.125, 0.5))
+
+
 def test_color_html_01():
     c = Color("#f00")
     try:
@@ -144,6 +177,14 @@ def test_color_html_01():
         assert True
 
 
+def test_color_html_02():
+    c = Color("rgba(10, 20, 30, 0.5)")
+    html1, html2 = c._repr_html_(), c._repr_html_()
+    assert "background: rgba(10, 20, 30, 0.5);" in html1
+    assert "HEXA: #0a141e7f" in html1
+    assert html1 != html2
+
+
 def test_color_or_01():
     r = Color("#f00")
     g = Color("#0f0")
@@ -192,6 +233,26 @@ def test_gradient_06():
     clrs = cm.cmaps.palettable.colorbrewer.sequential["BuGn_9"].mpl_colors
     grad2 = ColorGradient(clrs, "BuGn_9", alpha=0.5)
     assert grad1 == grad2
+    grad1.colors[0].r = 0
+    assert grad1 != grad2
+    assert grad1 != grad1[:1:3]
+
+
+def test_gradient_array_01():
+    rgba = cm.np.array([[1, 0, 0, 1], [0, 0, 1, 1]])
+    assert ColorGradient(rgba) == ColorGradient(["red", "blue"])
+    assert ColorGradient(rgba, alpha=0.5) == ColorGradient(["red", "blue"], alpha=0.5)
+
+
+def test_gradient_array_02():
+    grad = cm.cmaps.plotly.sequential.Viridis
+    key = cm.np.linspace(0, 1, 37)
+    assert grad[key] == ColorGradient([grad[x] for x in key])
+    with pytest.raises(IndexError, match="Invalid index: 1.5"):
+        grad[cm.np.array([0.5, 1.5])]
+    one = ColorGradient(["red"])
+    assert one[0.3] == Color("red")
+    assert one[cm.np.array([0.3])] == ColorGradient([one[0.3]])
 
 
 def test_gradient_07():
@@ -352,6 +413,15 @@ def test_swatch_01():
     swatch2 = swatch1.with_max(5)
     assert len(swatch1) == len(list(swatch1))
     assert swatch2.maxn == 5
+    assert swatch2.maps == swatch1.maps
+    assert swatch2.maps is not swatch1.maps
+    for grad1, grad2 in zip(swatch1.maps, swatch2.maps):
+        assert grad2 is not grad1
+        assert grad2.name == grad1.name
+        assert not set(map(id, grad2.colors)) & set(map(id, grad1.colors))
+    expected = swatch1.maps[0].hex
+    swatch2.maps[0].colors[0].g = 1.0
+    assert swatch1.maps[0].hex == expected
     swatch2.maps = []
     try:
         _ = swatch1._repr_html_()
@@ -379,6 +449,7 @@ def test_swatch_01():
         ("rgba_to_tup", "rgba(0, 0, 255, 0.5)", "(0, 0, 1, 0.5)"),
         ("rgba_to_tup", "rgba(0, 0, 255, .5)", "(0, 0, 1, 0.5)"),
         ("rgba_to_tup", "rgba(127, 127, 127, 0.5)", "(127/255, 127/255, 127/255, 0.5)"),
+        ("rgba_to_tup", "rgb(255, 0, 0) trailing", "None"),
         ("hexstr_to_tup", "not going to match", "None"),
         ("hexstr_to_tup", "#f00", "(1, 0, 0, 1)"),
         ("hexstr_to_tup", "#f00f", "(1, 0, 0, 1)"),
@@ -441,6 +512,102 @@ def test_funcs_01(func_name, input1, expected):
     assert func(input1) == expected
 
 
+def test_clrs_to_rgba():
+    rgba = cm.clrs_to_rgba(["red", "rgba(0, 0, 255, 0.5)", (0, 1, 0), Color("#fff")])
+    expected = [(1, 0, 0, 1), (0, 0, 1, 0.5), (0, 1, 0, 1), (1, 1, 1, 1)]
+    assert cm.np.array_equal(rgba, expected)
+    with pytest.raises(ValueError, match="Invalid color input."):
+        cm.clrs_to_rgba(["red", "not going to match"])
+
+
+def test_hexstr_to_tup_prop_cycle():
+    assert cm.hexstr_to_tup("C0") == cm.to_rgba("#1f77b4")
+    assert Color("C0").hex == "#1f77b4"
+    assert ColorGradient(["C0", "C1"]).colors[0].hex == "#1f77b4"
+    with cm.plt.rc_context({"axes.prop_cycle": cm.plt.cycler(color=["#00ff00"])}):
+        assert cm.hexstr_to_tup("C0") == (0, 1, 0, 1)
+        assert Color("C0").hex == "#00ff00"
+        assert ColorGradient(["C0", "C1"]).colors[0].hex == "#00ff00"
+
+
 def test_rgba_to_tup_exception():
     with pytest.raises(ValueError, match="Alpha must be between 0 and 1."):
         cm.rgba_to_tup("rgba(255, 0, 0, 1.5)")
+    with pytest.raises(ValueError, match="RGB values must be between 0 and 255."):
+        cm.rgba_to_tup("rgb(256, 0, 0)")
+
+
+def test_cmaps_lazy_import():
+    code = (
+        "import chromo_map as cm\n"
+        "c = cm.color\n"
+        "builders = [c._build_cmaps, *c._CMAP_BUILDERS.values()]\n"
+        "assert all(f.cache_info().currsize == 0 for f in builders)\n"
+        "assert {'cmaps', 'plotly_cmaps', 'mpl_cmaps'} <= set(dir(cm))\n"
+        "ns = {}\n"
+        "exec('from chromo_map import *', ns)\n"
+        "assert ns['cmaps'] is cm.cmaps and ns['mpl_cmaps'] is cm.cmaps.mpl\n"
+        "assert ns['palettable_cmaps'] is cm.palettable_cmaps\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cmaps_lazy():
+    mpl_cmaps = cm.mpl_cmaps
+    assert cm.color._build_mpl_cmaps.cache_info().currsize == 1
+    cmaps = cm.cmaps
+    assert cm.cmaps is cmaps
+    assert cmaps.mpl is mpl_cmaps
+    assert cm.plotly_cmaps is cmaps.plotly
+    assert cm.palettable_cmaps is cmaps.palettable
+    assert cm.mpl_cmaps is cmaps.mpl
+    with pytest.raises(
+        AttributeError, match="module 'chromo_map' has no attribute 'not_a_catalog'"
+    ):
+        _ = cm.not_a_catalog
+
+
+def test_colormaps_memoized():
+    carto = cm.PlotlyColorMaps({"Antique": cm.cmaps.plotly.carto["Antique"]})
+    grad1 = carto.Antique
+    grad2 = carto.Antique
+    assert grad1 == grad2
+    assert grad1 is not grad2
+    assert grad1.name == grad2.name == "Antique"
+    expected = grad1.hex
+    grad1.colors[0].r = 0
+    assert carto.Antique.hex == expected
+    assert grad2.hex == expected
+    carto["Antique"] = ["#f00", "#00f"]
+    assert carto.Antique == ColorGradient(["#f00", "#00f"])
+
+
+def test_colormaps_swatch_cached():
+    cmaps = cm.PlotlyColorMaps({"One": ["#f00", "#00f"]})
+    swatch = cmaps._swatch
+    assert cmaps._swatch is swatch
+    cmaps["Two"] = ["#0f0", "#00f"]
+    assert cmaps._swatch is not swatch
+    assert len(cmaps._swatch) == 2
+    swatch = cmaps._swatch
+    del cmaps["Two"]
+    assert len(cmaps._swatch) == 1
+    cmaps.update({"Two": ["#0f0", "#00f"]})
+    assert len(cmaps._swatch) == 2
+    cmaps.pop("Two")
+    assert len(cmaps._swatch) == 1
+    cmaps.setdefault("Two", ["#0f0", "#00f"])
+    assert len(cmaps._swatch) == 2
+    dict.update(cmaps, Three=["#fff", "#000"])
+    assert len(cmaps._swatch) == 3
+    cmaps.popitem()
+    assert len(cmaps._swatch) == 2
+    cmaps.clear()
+    assert len(cmaps._swatch) == 0
+    cmaps = cm.PlotlyColorMaps({"One": ["#f00", "#00f"], "extra": cm.np.array([1.0])})
+    swatch = cmaps._swatch
+    assert len(swatch) == 1
+    cmaps["extra"] = cm.np.array([1.0])
+    assert cmaps._swatch is not swatch
+    assert len(cmaps._swatch) == 1
+    _ = cmaps._repr_html_()